@@ -19,6 +19,7 @@ In production, you MUST use:
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+import asyncio
 import subprocess
 import tempfile
 import os
@@ -85,8 +86,11 @@ async def run_code(request: CodeExecutionRequest):
     
     try:
         # Execute the code using subprocess
+        # The blocking call runs in a worker thread so the event loop keeps
+        # serving other requests while this one waits (up to 5 seconds)
         # timeout=5 means the code will be killed after 5 seconds (TLE)
-        result = subprocess.run(
+        result = await asyncio.to_thread(
+            subprocess.run,
             [sys.executable, temp_file_path],  # Use same Python interpreter
             input=request.stdin,  # Pass stdin to the process
             capture_output=True,  # Capture stdout and stderr